@@ -1,14 +1,24 @@
 import streamlit as st
 import streamlit.components.v1 as components
+import base64
+import gzip
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-import plotly.io as pio
-import plotly.express as px
-import plotly.graph_objects as go
 import json
-from datetime import datetime
 import re
 
+try:
+    import orjson  # 2-12x faster than stdlib json on Plotly payloads
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash  # ~10x faster than sha1 for cache keys on large blobs
+except ImportError:
+    xxhash = None
+
 
 # --- 1. SETUP & CONFIGURATION ---
 st.set_page_config(layout="wide", page_title="NYC Airbnb Dashboard")
@@ -21,7 +31,9 @@ TIME_SERIES_DIR = os.path.join(CURRENT_DIR, "Time Series")
 MAPS_DIR = os.path.join(CURRENT_DIR, "Maps")
 HOOD_DIR = os.path.join(CURRENT_DIR, "Neighborhoods")
 MODEL_DIR = os.path.join(CURRENT_DIR, "Modelling")
-SUPPLY_DIR = os.path.join(CURRENT_DIR, "Supply") 
+SUPPLY_DIR = os.path.join(CURRENT_DIR, "Supply")
+# Streamlit serves this folder at /app/static/ (enableStaticServing)
+STATIC_DIR = os.path.join(CURRENT_DIR, "static")
 
 st.title("🗽 NYC Airbnb Market Analysis")
 st.markdown("""
@@ -31,105 +43,413 @@ st.markdown("""
 
 # --- 2. HELPER FUNCTIONS ---
 
+@st.cache_resource(show_spinner=False)
+def _build_file_manifest():
+    """
+    Walks the asset folders once at startup and maps basename -> absolute
+    path. Chart lookup becomes a single dict hit instead of up to five
+    os.path.exists stat calls per render.
+    """
+    manifest = {}
+    for d in (TIME_SERIES_DIR, MAPS_DIR, HOOD_DIR, MODEL_DIR, SUPPLY_DIR):
+        if not os.path.isdir(d):
+            continue
+        for fn in os.listdir(d):
+            manifest.setdefault(fn, os.path.join(d, fn))
+    return manifest
+
+
+FILE_MANIFEST = _build_file_manifest()
+
+
+@st.cache_resource(show_spinner=False)
+def _load_images():
+    """
+    Preloads every static PNG from the asset manifest into memory once, so
+    st.image serves cached bytes instead of re-reading the file per rerun.
+    """
+    images = {}
+    for fn, path in FILE_MANIFEST.items():
+        if fn.endswith('.png'):
+            with open(path, 'rb') as f:
+                images[fn] = f.read()
+    return images
+
+
+IMG_CACHE = _load_images()
+
+
+@st.cache_data(show_spinner=False)
+def _category_dfs():
+    """
+    Topic-analysis tables for the Review Trends page, categorized manually by
+    the keywords in each label. Constructed as DataFrames once and cached,
+    instead of four pd.DataFrame(list_of_dicts) builds per rerun.
+    """
+    categories = {
+        "General / Positive": [
+            {"Topic Label": "-1_clean_comfortable_subway_close", "Count": 6699},
+            {"Topic Label": "2_clean_responsive_comfortable_helpful", "Count": 737},
+            {"Topic Label": "0_clean_comfortable_responsive_like", "Count": 224},
+            {"Topic Label": "8_david_anthony_amy_comfortable", "Count": 56},
+            {"Topic Label": "11_cat_cats_friendly_cute", "Count": 54}
+        ],
+        "Location Based (Transit & Neighborhoods)": [
+            {"Topic Label": "7_williamsburg_restaurants_manhattan_bars", "Count": 129},
+            {"Topic Label": "5_harlem_subway_close_central", "Count": 100},
+            {"Topic Label": "1_brooklyn_subway_manhattan_close", "Count": 63},
+            {"Topic Label": "10_jfk_airport_close jfk_jfk airport", "Count": 52}
+        ],
+        "Attractions & Lifestyle": [
+            {"Topic Label": "4_hotel_staff_square_times square", "Count": 194},
+            {"Topic Label": "13_beach_rockaway_close beach_boardwalk", "Count": 45},
+            {"Topic Label": "12_ferry_staten_staten island_island", "Count": 41},
+            {"Topic Label": "15_italy_chinatown_soho_chinatown italy", "Count": 37}
+        ],
+        "Complaints & Issues": [
+            {"Topic Label": "3_did_didnt_refund_told", "Count": 149},
+            {"Topic Label": "6_noise_loud_noisy_hear", "Count": 64}
+        ]
+    }
+    return {name: pd.DataFrame(rows) for name, rows in categories.items()}
+
+
+# Precompiled regexes over bytes (the helpers read files in binary mode and
+# run ~20x per rerun, so skip both the text codec and the per-call
+# pattern-cache lookup; all patterns are ASCII-safe)
+_SVG_H_RE = re.compile(rb'(<svg[^>]*)\s+height="[^"]*"')
+_SVG_W_RE = re.compile(rb'(<svg[^>]*)\s+width="[^"]*"')
+_STYLE_H_RE = re.compile(rb'height:\s*[0-9]+px;?')
+_STYLE_W_RE = re.compile(rb'width:\s*[0-9]+px;?')
+_FRAME_DUR_RE = re.compile(rb'("frame":\s*\{\s*"duration":\s*)(\d+)')
+_TRANSITION_DUR_RE = re.compile(rb'("transition":\s*\{\s*"duration":\s*)(\d+)')
+
+_QUOTE, _BACKSLASH = ord('"'), ord('\\')
+
+# Responsive-sizing CSS injected into every chart/map document. Built from
+# module-level templates (one variant per max-width mode) instead of
+# rebuilding a ~700-char f-string on each of the ~20 calls per rerun.
+_CSS_TEMPLATE_BASE = """
+<style>
+    html, body {{
+        height: 100%;
+        width: 100%;
+        margin: 0;
+        padding: 0;
+        overflow: hidden;
+    }}
+    /* Force the container div to fill the height, capped at the iframe height */
+    .main-svg, .plotly-graph-div {{
+        height: 100% !important;
+        width: 100% !important;
+        max-height: {height}px !important;
+        {max_width_css}
+    }}
+    /* Ensure SVGs inside scale correctly */
+    svg {{
+        height: auto !important;
+        width: auto !important;
+        max-height: 100% !important;
+        max-width: 100% !important;
+    }}
+</style>
+"""
+_CSS_TEMPLATE_WIDTH = _CSS_TEMPLATE_BASE.replace('{max_width_css}', 'max-width: {width}px !important;')
+_CSS_TEMPLATE_NOWIDTH = _CSS_TEMPLATE_BASE.replace('{max_width_css}', 'max-width: 100% !important;')
+
+_MAP_DOC_OPEN = '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+
+
+def _css_injection(height, width):
+    """Renders the responsive CSS block for the given iframe dimensions."""
+    if width:
+        return _CSS_TEMPLATE_WIDTH.format(height=height, width=width)
+    return _CSS_TEMPLATE_NOWIDTH.format(height=height)
+
+
+def _is_animation_patched(raw, animation_duration):
+    """
+    True when the frame durations in the file already match the requested
+    value (zeros are allowed: the pause button keeps duration 0) and every
+    transition duration is 0 — i.e. the rewrite would be a no-op. Two
+    C-level scans, much cheaper than the locate/parse/dump cycle.
+    """
+    want = str(animation_duration).encode('ascii')
+    frame_durs = {m[1] for m in _FRAME_DUR_RE.findall(raw)}
+    if want not in frame_durs or not frame_durs <= {want, b'0'}:
+        return False
+    return {m[1] for m in _TRANSITION_DUR_RE.findall(raw)} == {b'0'}
+
+
+def _skip_json_value(raw, i):
+    """
+    Given raw[i] == ord('[') or ord('{'), returns the index just past the
+    matching close bracket (skipping string literals and escapes), or -1 if
+    unbalanced.
+    """
+    open_ch = raw[i]
+    close_ch = ord(']') if open_ch == ord('[') else ord('}')
+    depth = 0
+    in_str = False
+    escaped = False
+    for j in range(i, len(raw)):
+        ch = raw[j]
+        if in_str:
+            if escaped:
+                escaped = False
+            elif ch == _BACKSLASH:
+                escaped = True
+            elif ch == _QUOTE:
+                in_str = False
+        elif ch == _QUOTE:
+            in_str = True
+        elif ch == open_ch:
+            depth += 1
+        elif ch == close_ch:
+            depth -= 1
+            if depth == 0:
+                return j + 1
+    return -1
+
+
+def _find_layout_span(raw):
+    """
+    Locates the layout argument of Plotly.newPlot(...) with a single linear
+    scan: anchor on the call, skip the div-id and data-list arguments, then
+    bracket-count the layout dict. Returns (start, end) offsets or None.
+    Replaces the old DOTALL regexes, which could backtrack quadratically on
+    multi-MB Plotly HTML.
+    """
+    # rfind: the literal "Plotly.newPlot(" also appears inside the bundled
+    # plotly.js source; the real call Plotly writes is the last one
+    anchor = raw.rfind(b'Plotly.newPlot(')
+    if anchor == -1:
+        return None
+    # Skip the div-id argument (a quoted string, no commas inside)
+    i = raw.find(b',', anchor + len(b'Plotly.newPlot('))
+    if i == -1:
+        return None
+    # Skip the data-list argument
+    i = raw.find(b'[', i)
+    if i == -1:
+        return None
+    i = _skip_json_value(raw, i)
+    if i == -1:
+        return None
+    # The next object is the layout
+    start = raw.find(b'{', i)
+    if start == -1:
+        return None
+    end = _skip_json_value(raw, start)
+    if end == -1:
+        return None
+    return start, end
+
+
+# Bootstrap page that carries the chart HTML as a base64 gzip blob and
+# inflates it client-side. Plotly HTML compresses ~10-20x, so this cuts the
+# bytes shipped over Streamlit's websocket per rerun by roughly that factor.
+_GZIP_WRAPPER_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"></head>
+<body style="margin:0;height:100vh;overflow:hidden">
+<script>
+(async function () {
+    if (typeof DecompressionStream === "undefined") {
+        document.body.textContent = "This browser is too old to display the embedded chart.";
+        return;
+    }
+    var bytes = Uint8Array.from(atob("__B64__"), function (c) { return c.charCodeAt(0); });
+    var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+    var html = await new Response(stream).text();
+    var frame = document.createElement("iframe");
+    frame.style.cssText = "border:0;width:100%;height:100%";
+    frame.srcdoc = html;
+    document.body.appendChild(frame);
+})();
+</script>
+</body>
+</html>"""
+
+
+def _wrap_gzipped(full_html):
+    """
+    Gzip-compresses the rendered chart HTML (bytes) and embeds it in the tiny
+    self-inflating wrapper above. Called inside the cached builders, so the
+    compression cost is paid once per file, not per rerun. Returns
+    (digest, wrapper_html): the content digest keys the static-served copy.
+    mtime=0 keeps the gzip output — and therefore the digest — stable.
+    """
+    payload = gzip.compress(full_html, compresslevel=6, mtime=0)
+    # Cache key, not a security boundary: XXH3 hashes multi-MB payloads
+    # ~10x faster than sha1 and its 64-bit space is plenty for ~20 files
+    if xxhash is not None:
+        digest = xxhash.xxh3_64_hexdigest(payload)
+    else:
+        digest = hashlib.sha1(payload).hexdigest()
+    wrapper = _GZIP_WRAPPER_TEMPLATE.replace('__B64__', base64.b64encode(payload).decode('ascii'))
+    return digest, wrapper
+
+
+def _publish_html(digest, wrapper_html):
+    """
+    Writes the wrapper document to the static folder under its content hash
+    (once) and returns the stable URL path. Because the URL only changes when
+    the content does, the browser keeps the iframe document cached across
+    reruns instead of re-receiving it over the websocket.
+    """
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    path = os.path.join(STATIC_DIR, f"{digest}.html")
+    if not os.path.exists(path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(wrapper_html)
+    return f"app/static/{digest}.html"
+
+
+def _json_loads(s):
+    """Parse JSON (str or bytes) via orjson when available (stdlib fallback)."""
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+def _json_dumps(obj):
+    """Serialize JSON via orjson when available; always returns bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+@st.cache_data(show_spinner=False)
+def _build_full_html(file_path, mtime, height, width, animation_duration):
+    """
+    Reads and transforms a Plotly HTML file (animation patching, responsive CSS).
+    Pure in (file_path, mtime, height, width, animation_duration), so the result
+    is cached across reruns; mtime is part of the key so edits invalidate it.
+    """
+    # Binary read: one C-level read() instead of the text-IO codec loop;
+    # all downstream transforms operate on bytes
+    with open(file_path, 'rb') as f:
+        html_content = f.read()
+
+    # 1. Animation Speed Logic
+    if "animated" in file_path and not _is_animation_patched(html_content, animation_duration):
+        span = _find_layout_span(html_content)
+        if span:
+            start, end = span
+            layout_str = html_content[start:end]
+            # Only patch the layout dict if it actually drives an animation
+            if b'"updatemenus"' in layout_str:
+                # Set the button/slider speeds with two byte-level regex
+                # substitutions on the layout slice — no JSON parse, no
+                # multi-MB dict materialized in Python memory. (The pause
+                # button's frame duration is rewritten too, but it runs in
+                # "immediate" mode where the value is ignored.)
+                dur = str(animation_duration).encode('ascii')
+                layout_str = _FRAME_DUR_RE.sub(rb'\g<1>' + dur, layout_str)
+                layout_str = _TRANSITION_DUR_RE.sub(rb'\g<1>0', layout_str)
+                # Splice at the known offsets — str.replace would rescan
+                # the whole multi-MB buffer to re-find layout_str
+                html_content = html_content[:start] + layout_str + html_content[end:]
+
+    # 2. FORCE RESPONSIVENESS
+    # Remove fixed height/width attributes from SVG tags so they can scale
+    html_content = _SVG_H_RE.sub(rb'\1', html_content)
+    html_content = _SVG_W_RE.sub(rb'\1', html_content)
+
+    # Inject CSS to force the plot to take up 100% of the iframe (single
+    # encode of the small CSS block; the multi-MB chart HTML itself is
+    # never decoded)
+    css_bytes = _css_injection(height, width).encode('utf-8')
+    if b"</head>" in html_content:
+        full_html = html_content.replace(b"</head>", css_bytes + b"</head>")
+    else:
+        full_html = css_bytes + html_content
+
+    return _wrap_gzipped(full_html)
+
+
+@st.cache_data(show_spinner=False)
+def _build_map_html(file_path, mtime, height, width):
+    """
+    Builds the full HTML document for a Plotly map fragment (regex cleanup +
+    responsive CSS wrapper). Cached across reruns keyed on path + mtime.
+    """
+    # Binary read, same rationale as _build_full_html
+    with open(file_path, 'rb') as f:
+        html_fragment = f.read()
+
+    # 1. REGEX CLEANUP
+    # Strip inline style dimensions (e.g., style="height:450px;")
+    html_fragment = _STYLE_H_RE.sub(b'', html_fragment)
+    html_fragment = _STYLE_W_RE.sub(b'', html_fragment)
+
+    # Also strip attribute dimensions just in case (e.g., height="450")
+    html_fragment = _SVG_H_RE.sub(rb'\1', html_fragment)
+    html_fragment = _SVG_W_RE.sub(rb'\1', html_fragment)
+
+    # 2. ROBUST CSS WRAPPER (same template as _build_full_html)
+    doc_head = _MAP_DOC_OPEN + _css_injection(height, width) + '</head>\n<body>\n'
+
+    # Wrap the raw fragment bytes without ever decoding them
+    full_html = doc_head.encode('utf-8') + html_fragment + b'\n</body>\n</html>\n'
+
+    return _wrap_gzipped(full_html)
+
+
+@st.cache_resource(show_spinner=False)
+def _load_figure_json(file_path, mtime):
+    """Loads a Plotly figure saved with fig.write_json(...), once per file."""
+    import plotly.io as pio  # deferred: only needed when JSON exports exist
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return pio.from_json(f.read())
+
+
 def display_html_file(file_path, height=600, width=None, scrolling=True, animation_duration=50):
     """
     Reads an HTML file (standard Plotly charts), strips internal height restrictions,
     and forces it to fill the Streamlit component area.
     """
-    # 1. Path Verification
-    if not os.path.exists(file_path):
-        filename = os.path.basename(file_path)
-        # Fallback search in common folders
-        alt_paths = [
-            os.path.join(CURRENT_DIR, filename), 
-            os.path.join(TIME_SERIES_DIR, filename), 
-            os.path.join(MAPS_DIR, filename),
-            os.path.join(HOOD_DIR, filename),
-            os.path.join(MODEL_DIR, filename),
-        ]
-        
-        found = False
-        for p in alt_paths:
-            if os.path.exists(p):
-                file_path = p
-                found = True
-                break
-        
-        if not found:
-            st.warning(f"⚠️ Chart not found: `{filename}`")
+    # 1. Path Resolution (single dict lookup against the startup manifest)
+    filename = os.path.basename(file_path)
+    resolved = FILE_MANIFEST.get(filename)
+    if resolved is None and os.path.exists(file_path):
+        resolved = file_path
+    if resolved is None:
+        st.warning(f"⚠️ Chart not found: `{filename}`")
+        return
+    file_path = resolved
+
+    # 2. Prefer a pre-patched copy baked by tools/patch_animations.py, so
+    # the animation rewrite never runs at request time
+    if "animated" in filename:
+        stem, ext = os.path.splitext(filename)
+        patched = FILE_MANIFEST.get(f"{stem}.{animation_duration}ms{ext}")
+        if patched is not None:
+            file_path = patched
+
+    # 3. Prefer a JSON figure export when one sits next to the HTML:
+    # st.plotly_chart shares one plotly.js bundle across all charts instead
+    # of embedding ~3 MB per iframe, and serializes through orjson
+    fig_path = FILE_MANIFEST.get(os.path.splitext(filename)[0] + '.json')
+    if fig_path is not None:
+        try:
+            fig = _load_figure_json(fig_path, os.path.getmtime(fig_path))
+            st.plotly_chart(fig, use_container_width=True)
+            return
+        except Exception as e:
+            st.error(f"Error reading figure json: {e}")
             return
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-            
-            # 2. Animation Speed Logic
-            if "animated" in file_path:
-                match = re.search(r'Plotly\.newPlot\((.*)\);', html_content, re.DOTALL)
-                if match:
-                    # Regex to find the layout dict specifically containing updatemenus
-                    layout_match = re.search(r'Plotly\.newPlot\([^,]+,\s*\[.*?\],\s*({.*"updatemenus":.*}),\s*{.*}\);', html_content, re.DOTALL)
-                    if layout_match:
-                        layout_str = layout_match.group(1)
-                        try:
-                            layout_json = json.loads(layout_str)
-                            # Update Button Speed
-                            layout_json['updatemenus'][0]['buttons'][0]['args'][1]['frame']['duration'] = animation_duration
-                            layout_json['updatemenus'][0]['buttons'][0]['args'][1]['transition']['duration'] = 0
-                            # Update Slider Speed
-                            if 'sliders' in layout_json:
-                                for step in layout_json['sliders'][0]['steps']:
-                                    step['args'][1]['frame']['duration'] = animation_duration
-                                    step['args'][1]['transition']['duration'] = 0
-                            
-                            html_content = html_content.replace(layout_str, json.dumps(layout_json))
-                        except json.JSONDecodeError:
-                            pass 
-
-            # 3. FORCE RESPONSIVENESS (Restored from your original code)
-            # Remove fixed height/width attributes from SVG tags so they can scale
-            html_content = re.sub(r'(<svg[^>]*)\s+height="[^"]*"', r'\1', html_content)
-            html_content = re.sub(r'(<svg[^>]*)\s+width="[^"]*"', r'\1', html_content)
-            
-            # Handle max-width logic safely for CSS string
-            max_width_css = f"max-width: {width}px !important;" if width else "max-width: 100% !important;"
-
-            # Inject CSS to force the plot to take up 100% of the iframe
-            css_injection = f"""
-            <style>
-                html, body {{
-                    height: 100%;
-                    width: 100%;
-                    margin: 0;
-                    padding: 0;
-                    overflow: hidden;
-                }}
-                /* Force the container div to fill the height */
-                .main-svg, .plotly-graph-div {{
-                    height: 100% !important;
-                    width: 100% !important;
-                    max-height: {height}px !important;
-                    {max_width_css}
-                }}
-                /* Force the SVG to fill the height */
-                svg {{
-                    height: auto !important;
-                    width: auto !important;
-                    max-height: 100% !important;
-                    max-width: 100% !important;
-                }}
-            </style>
-            """
-            
-            # Inject CSS
-            if "</head>" in html_content:
-                full_html = html_content.replace("</head>", f"{css_injection}</head>")
-            else:
-                full_html = css_injection + html_content
-            
-            # 4. Render
-            components.html(full_html, height=height, width=width, scrolling=scrolling)
-            
+        # 4. Build (cached) & Render via a hash-stable static URL so the
+        # browser can cache the iframe document across reruns
+        digest, wrapper = _build_full_html(file_path, os.path.getmtime(file_path), height, width, animation_duration)
+        try:
+            components.iframe(_publish_html(digest, wrapper), height=height, width=width, scrolling=scrolling)
+        except OSError:
+            components.html(wrapper, height=height, width=width, scrolling=scrolling)
+
     except Exception as e:
         st.error(f"Error reading file: {e}")
 
@@ -138,82 +458,56 @@ def display_html_map(file_path, height=600, width=None):
     Specialized function for displaying Plotly HTML fragments (Maps).
     Wraps the raw DIV in a full HTML structure and enforces responsive sizing.
     """
-    # 1. Path Verification
-    if not os.path.exists(file_path):
-        filename = os.path.basename(file_path)
-        alt_paths = [
-            os.path.join(CURRENT_DIR, "Maps", filename),
-        ]
-        found = False
-        for p in alt_paths:
-            if os.path.exists(p):
-                file_path = p
-                found = True
-                break
-        
-        if not found:
-            st.warning(f"⚠️ Map not found: `{filename}`")
-            return
+    # 1. Path Resolution (single dict lookup against the startup manifest)
+    filename = os.path.basename(file_path)
+    resolved = FILE_MANIFEST.get(filename)
+    if resolved is None and os.path.exists(file_path):
+        resolved = file_path
+    if resolved is None:
+        st.warning(f"⚠️ Map not found: `{filename}`")
+        return
+    file_path = resolved
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            html_fragment = f.read()
-
-        # 2. REGEX CLEANUP
-        # Strip inline style dimensions (e.g., style="height:450px;")
-        import re
-        html_fragment = re.sub(r'height:\s*[0-9]+px;?', '', html_fragment)
-        html_fragment = re.sub(r'width:\s*[0-9]+px;?', '', html_fragment)
-        
-        # Also strip attribute dimensions just in case (e.g., height="450")
-        html_fragment = re.sub(r'(<svg[^>]*)\s+height="[^"]*"', r'\1', html_fragment)
-        html_fragment = re.sub(r'(<svg[^>]*)\s+width="[^"]*"', r'\1', html_fragment)
-
-        # 3. ROBUST CSS WRAPPER (Aligned with display_html_file)
-        max_width_css = f"max-width: {width}px !important;" if width else "max-width: 100% !important;"
-
-        full_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                html, body {{
-                    height: 100%;
-                    width: 100%;
-                    margin: 0;
-                    padding: 0;
-                    overflow: hidden;
-                }}
-                /* Force the container div to fill the height, capped at the iframe height */
-                .main-svg, .plotly-graph-div {{
-                    height: 100% !important;
-                    width: 100% !important;
-                    max-height: {height}px !important;
-                    {max_width_css}
-                }}
-                /* Ensure SVGs inside scale correctly */
-                svg {{
-                    height: auto !important;
-                    width: auto !important;
-                    max-height: 100% !important;
-                    max-width: 100% !important;
-                }}
-            </style>
-        </head>
-        <body>
-            {html_fragment}
-        </body>
-        </html>
-        """
-
-        # 4. RENDER
+        # 2. Build (cached) & Render via a hash-stable static URL
         # Width=None lets Streamlit handle the responsive column width
-        components.html(full_html, height=height, width=width, scrolling=False)
+        digest, wrapper = _build_map_html(file_path, os.path.getmtime(file_path), height, width)
+        try:
+            components.iframe(_publish_html(digest, wrapper), height=height, width=width, scrolling=False)
+        except OSError:
+            components.html(wrapper, height=height, width=width, scrolling=False)
 
     except Exception as e:
         st.error(f"Error reading map file: {e}")
-        
+
+
+@st.cache_resource(show_spinner=False)
+def _warm_html_cache():
+    """
+    Pre-fills the cached HTML builders for every asset on first boot instead
+    of paying the read+transform cost the first time each page is visited.
+    Threads overlap the disk reads with the regex/gzip work (both release
+    the GIL in C code), so warmup takes roughly the longest file, not the
+    sum of all of them.
+    """
+    def _warm(path):
+        try:
+            mtime = os.path.getmtime(path)
+            if os.path.dirname(path) == MAPS_DIR:
+                _build_map_html(path, mtime, 600, None)
+            else:
+                _build_full_html(path, mtime, 600, None, 50)
+        except Exception:
+            pass  # real renders surface their own errors
+
+    html_paths = [p for fn, p in FILE_MANIFEST.items() if fn.endswith('.html')]
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(_warm, html_paths))
+    return True
+
+
+_warm_html_cache()
+
 # --- 3. SIDEBAR NAVIGATION ---
 st.sidebar.title("Navigation")
 page = st.sidebar.radio("Go to section:", 
@@ -232,52 +526,29 @@ if page == "Review Trends":
     # Animated Trend
     display_html_file(os.path.join(TIME_SERIES_DIR, "overall_review_trend_animated.html"), height=600, animation_duration=50)
     
+    # Below-the-fold charts live in collapsed expanders so their iframe
+    # payloads are only shipped when opened (re-opening is instant from cache)
     #Borough Trend
-    st.subheader("Borough-Level Trends")
-    st.markdown("Review volume trends for each NYC borough.")
-    display_html_file(os.path.join(TIME_SERIES_DIR, "borough_review_trend.html"), height=600)
-    
+    with st.expander("📊 Borough-Level Trends", expanded=False):
+        st.markdown("Review volume trends for each NYC borough.")
+        display_html_file(os.path.join(TIME_SERIES_DIR, "borough_review_trend.html"), height=600)
+
     #Top neighborhoods Trend
-    st.subheader("Top Neighborhoods by Reviews")
-    st.markdown("Review volume trends for the top 10 neighborhoods.")
-    display_html_file(os.path.join(TIME_SERIES_DIR, "nbhd_review_trend.html"), height=600)
+    with st.expander("📊 Top Neighborhoods by Reviews", expanded=False):
+        st.markdown("Review volume trends for the top 10 neighborhoods.")
+        display_html_file(os.path.join(TIME_SERIES_DIR, "nbhd_review_trend.html"), height=600)
 
-    st.subheader("Trend Decomposition")
-    display_html_file(os.path.join(TIME_SERIES_DIR, "time_series_decomposition.html"), height=900)
-    
-    st.subheader("Seasonality Patterns")
-    display_html_file(os.path.join(TIME_SERIES_DIR, "seasonality_monthly_boxplot.html"), height=500)
-    
-    st.subheader("Monthly Multiplicative Effect (OLS Model)")
-    display_html_file(os.path.join(TIME_SERIES_DIR, "ols_monthly_odds_ratios.html"), height=500)
+    with st.expander("📊 Trend Decomposition", expanded=False):
+        display_html_file(os.path.join(TIME_SERIES_DIR, "time_series_decomposition.html"), height=900)
+
+    with st.expander("📊 Seasonality Patterns", expanded=False):
+        display_html_file(os.path.join(TIME_SERIES_DIR, "seasonality_monthly_boxplot.html"), height=500)
+
+    with st.expander("📊 Monthly Multiplicative Effect (OLS Model)", expanded=False):
+        display_html_file(os.path.join(TIME_SERIES_DIR, "ols_monthly_odds_ratios.html"), height=500)
     
-    # 1. Prepare Data Categorized by Section
-    # We manually categorize based on the keywords in the label
-    categories = {
-        "General / Positive": [
-            {"Topic Label": "-1_clean_comfortable_subway_close", "Count": 6699},
-            {"Topic Label": "2_clean_responsive_comfortable_helpful", "Count": 737},
-            {"Topic Label": "0_clean_comfortable_responsive_like", "Count": 224},
-            {"Topic Label": "8_david_anthony_amy_comfortable", "Count": 56},
-            {"Topic Label": "11_cat_cats_friendly_cute", "Count": 54}
-        ],
-        "Location Based (Transit & Neighborhoods)": [
-            {"Topic Label": "7_williamsburg_restaurants_manhattan_bars", "Count": 129},
-            {"Topic Label": "5_harlem_subway_close_central", "Count": 100},
-            {"Topic Label": "1_brooklyn_subway_manhattan_close", "Count": 63},
-            {"Topic Label": "10_jfk_airport_close jfk_jfk airport", "Count": 52}
-        ],
-        "Attractions & Lifestyle": [
-            {"Topic Label": "4_hotel_staff_square_times square", "Count": 194},
-            {"Topic Label": "13_beach_rockaway_close beach_boardwalk", "Count": 45},
-            {"Topic Label": "12_ferry_staten_staten island_island", "Count": 41},
-            {"Topic Label": "15_italy_chinatown_soho_chinatown italy", "Count": 37}
-        ],
-        "Complaints & Issues": [
-            {"Topic Label": "3_did_didnt_refund_told", "Count": 149},
-            {"Topic Label": "6_noise_loud_noisy_hear", "Count": 64}
-        ]
-    }
+    # 1. Topic tables (built once, cached across reruns)
+    CATEGORY_DFS = _category_dfs()
 
     # 2. Main Title
     st.subheader("🗂️ Topic Analysis by Category")
@@ -292,8 +563,7 @@ if page == "Review Trends":
     ])
 
     # Helper function to display a dataframe within a tab
-    def display_category(data_list):
-        df = pd.DataFrame(data_list)
+    def display_category(df):
         st.dataframe(
             df,
             column_config={
@@ -314,45 +584,45 @@ if page == "Review Trends":
     with tab1:
         st.markdown("##### The 'Standard' Experience")
         st.info("These topics represent the baseline positive Airbnb experience (Clean, Comfortable, Responsive).")
-        display_category(categories["General / Positive"])
+        display_category(CATEGORY_DFS["General / Positive"])
 
     with tab2:
         st.markdown("##### Key Neighborhood Hubs")
         st.info("Clusters defined primarily by their proximity to transit or specific boroughs.")
-        display_category(categories["Location Based (Transit & Neighborhoods)"])
+        display_category(CATEGORY_DFS["Location Based (Transit & Neighborhoods)"])
 
     with tab3:
         st.markdown("##### Tourism & Vibes")
         st.info("Clusters centered around specific activities (Beaches, Ferries) or famous landmarks (Times Square).")
-        display_category(categories["Attractions & Lifestyle"])
+        display_category(CATEGORY_DFS["Attractions & Lifestyle"])
 
     with tab4:
         st.markdown("##### The Red Flags")
         st.warning("These topics define the 'Avoid' list—specifically Refunds and Noise issues.")
-        display_category(categories["Complaints & Issues"])
+        display_category(CATEGORY_DFS["Complaints & Issues"])
     
 elif page == "Supply and Demand Dynamics":
     st.markdown('<script>window.scrollTo(0, 0);</script>', unsafe_allow_html=True)
     st.header("🏘️ Supply and Demand Dynamics")
     st.subheader("Zombie Listings")
     st.markdown("Listings that remain active on the platform but receive zero reviews over a prolonged period.")
-    st.image(os.path.join(SUPPLY_DIR, "zombie.png"), caption="Zombie Listings by Borough", width=800)
+    st.image(IMG_CACHE["zombie.png"], caption="Zombie Listings by Borough", width=800)
     
     st.subheader("Review Count vs Intensity")
     st.markdown("Which Borough gets more reviews per listing?")
-    st.image(os.path.join(SUPPLY_DIR, "intensity.png"), caption="Review Count vs Intensity", width=800)
+    st.image(IMG_CACHE["intensity.png"], caption="Review Count vs Intensity", width=800)
     
     st.subheader("Listing Growth vs Average Revenue Per Month")
     st.markdown("Analyzing how the growth in listing numbers correlates with average revenue per month across boroughs.")
-    st.image(os.path.join(SUPPLY_DIR, "growth_rev.png"), caption="Listing Growth vs Average Revenue Per Month", width=500)
+    st.image(IMG_CACHE["growth_rev.png"], caption="Listing Growth vs Average Revenue Per Month", width=500)
     
     st.subheader("Near Term Vacancy Rates")
     st.markdown("Which boroughs have the highest vacancy rates in the next 30 days?")
-    st.image(os.path.join(SUPPLY_DIR, "vacancy.png"), caption="Near Term Vacancy Rates by Borough", width=800)
+    st.image(IMG_CACHE["vacancy.png"], caption="Near Term Vacancy Rates by Borough", width=800)
     
     st.subheader("Freshness of Listings")
     st.markdown("What percent of listings have their first review in the last 6 months?")
-    st.image(os.path.join(SUPPLY_DIR, "freshness.png"), caption="Freshness of Listings by Borough", width=800)
+    st.image(IMG_CACHE["freshness.png"], caption="Freshness of Listings by Borough", width=800)
 
 elif page == "Borough & Neighborhood Analysis":
     st.markdown('<script>window.scrollTo(0, 0);</script>', unsafe_allow_html=True)
@@ -360,46 +630,48 @@ elif page == "Borough & Neighborhood Analysis":
     st.subheader("Borough Pricing Dynamics")
     display_html_file(os.path.join(HOOD_DIR, "borough_value_map.html"), height=600)
     
-    st.subheader("Safety")
-    display_html_map(os.path.join(MAPS_DIR, "safety_map.html"))
-    
-    st.subheader("Pests")
-    display_html_map(os.path.join(MAPS_DIR, "pest_heatmap.html"))
-    
-    st.subheader("Noise Levels")
-    col1, col2 = st.columns([1,1])
-    with col1:
-        display_html_file(os.path.join(HOOD_DIR, "noise_scatter.html"), height=600)
-    with col2:
-        display_html_file(os.path.join(HOOD_DIR, "noise_table.html"), height=600)
-        
-    st.subheader("Proximity to Attractions")
-    st.markdown("How price and ratings vary with distance to Times Square and Central Park.")
-    col1, col2 = st.columns([1,1])
-    with col1:
-        st.markdown("**Proximity**")
-        display_html_file(os.path.join(HOOD_DIR, "luxury_premium_scatter.html"), height=800)
-    with col2:
-        st.markdown("**Rating**")
-        display_html_file(os.path.join(HOOD_DIR, "rating_distance_scatter.html"), height=800)   
-        
-    st.subheader("Trending Neighborhoods")
-    st.markdown("Scored by **Momentum** which is defined as the rate of reviews in the last 30 days, over their long term monthly average. Adjusted to city median.")
-    display_html_file(os.path.join(HOOD_DIR, "hot_list.html"), height=600)
-    display_html_file(os.path.join(HOOD_DIR, "cold_list.html"), height=600)
-    
-        
+    # Keep the headline map visible; everything below the fold is collapsed
+    # so only the open panel's iframe payload ships per rerun
+    with st.expander("🚨 Safety", expanded=False):
+        display_html_map(os.path.join(MAPS_DIR, "safety_map.html"))
+
+    with st.expander("🐀 Pests", expanded=False):
+        display_html_map(os.path.join(MAPS_DIR, "pest_heatmap.html"))
+
+    with st.expander("🔊 Noise Levels", expanded=False):
+        col1, col2 = st.columns([1,1])
+        with col1:
+            display_html_file(os.path.join(HOOD_DIR, "noise_scatter.html"), height=600)
+        with col2:
+            display_html_file(os.path.join(HOOD_DIR, "noise_table.html"), height=600)
+
+    with st.expander("🗺️ Proximity to Attractions", expanded=False):
+        st.markdown("How price and ratings vary with distance to Times Square and Central Park.")
+        col1, col2 = st.columns([1,1])
+        with col1:
+            st.markdown("**Proximity**")
+            display_html_file(os.path.join(HOOD_DIR, "luxury_premium_scatter.html"), height=800)
+        with col2:
+            st.markdown("**Rating**")
+            display_html_file(os.path.join(HOOD_DIR, "rating_distance_scatter.html"), height=800)
+
+    with st.expander("🔥 Trending Neighborhoods", expanded=False):
+        st.markdown("Scored by **Momentum** which is defined as the rate of reviews in the last 30 days, over their long term monthly average. Adjusted to city median.")
+        display_html_file(os.path.join(HOOD_DIR, "hot_list.html"), height=600)
+        display_html_file(os.path.join(HOOD_DIR, "cold_list.html"), height=600)
+
+
     st.header("The Rise of Corporate Hosts")
     st.markdown("Mapping the concentration of corporate-owned listings across NYC neighborhoods. Corporate hosts are defined by having a high 'Empire Score'.")
     st.markdown("**Empire Score** = Log(Listings) + Superhost Status + Instant Book")
-    st.subheader("Corporate Host Map")
-    display_html_map(os.path.join(MAPS_DIR, "corporate_invasion_map.html"), height=600)
-    st.subheader("Host Composition by Borough")
-    st.markdown("Percentage of listings by host type across boroughs.")
-    display_html_file(os.path.join(HOOD_DIR, "host_composition.html"), height=600)
-    st.subheader("Scam Risk by Host Tier")
-    st.markdown("Percentage of listings with mentions of 'scam' in reviews, segmented by host tier.")
-    display_html_file(os.path.join(HOOD_DIR, "scam_risk_host_tier.html"), height=500)
+    with st.expander("🏢 Corporate Host Map", expanded=False):
+        display_html_map(os.path.join(MAPS_DIR, "corporate_invasion_map.html"), height=600)
+    with st.expander("🏙️ Host Composition by Borough", expanded=False):
+        st.markdown("Percentage of listings by host type across boroughs.")
+        display_html_file(os.path.join(HOOD_DIR, "host_composition.html"), height=600)
+    with st.expander("⚠️ Scam Risk by Host Tier", expanded=False):
+        st.markdown("Percentage of listings with mentions of 'scam' in reviews, segmented by host tier.")
+        display_html_file(os.path.join(HOOD_DIR, "scam_risk_host_tier.html"), height=500)
     
 
 elif page == "Modelling":
@@ -440,7 +712,7 @@ elif page == "Modelling":
     st.subheader("Price Prediction Model Performance")
     st.markdown("R² score of .785, a MAE of \$56 and a RSME of \$117 on the test set.")
     #Display PNG File of SHAP Plots
-    st.image(os.path.join(MODEL_DIR, "SHAP Price.png"), caption="SHAP Plot for Price Prediction Model",width=800)
+    st.image(IMG_CACHE["SHAP Price.png"], caption="SHAP Plot for Price Prediction Model",width=800)
     st.markdown("""
     **SHAP Plot Summary**   
     Targets listing price. The most impactful variables are the Manhattan neighborhood group, minimum nights, accommodates and private room type.
@@ -448,7 +720,7 @@ elif page == "Modelling":
     
     st.subheader("Revenue Prediction Model Performance")
     st.markdown("R² of .724, a MAE of \$6,949 and a RMSE of \$16,339 on the test set.")
-    st.image(os.path.join(MODEL_DIR, "SHAP Revenue.png"), caption="SHAP Plot for Revenue Prediction Model", width=800)
+    st.image(IMG_CACHE["SHAP Revenue.png"], caption="SHAP Plot for Revenue Prediction Model", width=800)
     st.markdown("""
     **SHAP Plot Summary**   
     Targets last 365-day revenue. The most impactful variables are Host Service Score, composite review score and cleanliness score.
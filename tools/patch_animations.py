@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+One-off build step: bakes the dashboard's animation speed into the animated
+Plotly HTML exports so the app never rewrites them at request time.
+
+For each *_animated.html under "Time Series", writes a sibling
+*_animated.<duration>ms.html with every frame duration set to <duration>
+and every transition duration set to 0. display_html_file in
+streamlit_app.py picks the pre-patched copy up automatically when it
+exists in the asset manifest.
+
+Usage: python tools/patch_animations.py [duration_ms]
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit_app import (
+    TIME_SERIES_DIR,
+    _find_layout_span,
+    _is_animation_patched,
+    _json_loads,
+    _json_dumps,
+)
+
+
+def patch_file(path, duration):
+    """Returns the patched file bytes, or None if no animation layout found."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if _is_animation_patched(raw, duration):
+        return raw
+    span = _find_layout_span(raw)
+    if span is None:
+        return None
+    start, end = span
+    layout = _json_loads(raw[start:end])
+    if 'updatemenus' not in layout:
+        return None
+    layout['updatemenus'][0]['buttons'][0]['args'][1]['frame']['duration'] = duration
+    layout['updatemenus'][0]['buttons'][0]['args'][1]['transition']['duration'] = 0
+    if 'sliders' in layout:
+        for step in layout['sliders'][0]['steps']:
+            step['args'][1]['frame']['duration'] = duration
+            step['args'][1]['transition']['duration'] = 0
+    return raw[:start] + _json_dumps(layout) + raw[end:]
+
+
+def main():
+    duration = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    for fn in sorted(os.listdir(TIME_SERIES_DIR)):
+        stem, ext = os.path.splitext(fn)
+        if not (stem.endswith('_animated') and ext == '.html'):
+            continue
+        src = os.path.join(TIME_SERIES_DIR, fn)
+        dst = os.path.join(TIME_SERIES_DIR, f"{stem}.{duration}ms{ext}")
+        patched = patch_file(src, duration)
+        if patched is None:
+            print(f"skipped {fn}: no animation layout found")
+            continue
+        with open(dst, 'wb') as f:
+            f.write(patched)
+        print(f"wrote {os.path.basename(dst)}")
+
+
+if __name__ == '__main__':
+    main()